@@ -1,22 +1,53 @@
+import atexit
 import time
 import sys
-from datetime import timedelta
 import os
 import shutil
-import pyaudio
 import wave
-import tempfile
 import json
-from threading import Event, Lock, Thread
+import mmap
+import re
+import signal
+import struct
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event, Thread
+
+# The keyboard helpers need exactly one of these depending on the platform;
+# resolve it once here instead of re-importing inside the input loops.
+if sys.platform == 'win32':
+    import msvcrt
+else:
+    import select
+    import termios
+    import tty
+
+# pyaudio links PortAudio (which enumerates audio devices) at import, so it
+# is loaded lazily by get_pa() — the list/trash/settings screens never pay
+# for it.
+pyaudio = None
 
 # ------------------- Config -------------------
-CHUNK = 1024
-FORMAT = pyaudio.paInt16   # We keep 16-bit for all quality levels
+# Frames per PortAudio capture buffer. A recorder has no tight latency
+# needs, so the presets default to 4096 (~85-93 ms) to cut the callback
+# rate — and the Python dispatch cost per callback — by 4x versus the old
+# 1024. RECORDER_CHUNK still overrides for experiments.
+_CHUNK_ENV = os.environ.get("RECORDER_CHUNK")
+CHUNK = int(_CHUNK_ENV) if _CHUNK_ENV else None
+FORMAT = None   # pyaudio.paInt16 — filled in when pyaudio is first loaded
+
+# PortAudio callback return codes. The numeric values are part of the stable
+# PortAudio ABI, so the realtime callbacks can use them without attribute
+# lookups or the module being loaded yet.
+PA_CONTINUE = 0
+PA_COMPLETE = 1
+
+# Bytes per sample — we keep 16-bit for all quality levels.
+SAMPLE_WIDTH = 2
 
 QUALITY_PRESETS = {
-    "high":   {"rate": 48000, "channels": 2, "name": "High (48 kHz stereo)"},
-    "medium": {"rate": 44100, "channels": 2, "name": "Medium (44.1 kHz stereo)"},
-    "low":    {"rate": 44100, "channels": 1, "name": "Low (44.1 kHz mono)"}
+    "high":   {"rate": 48000, "channels": 2, "buffer": 4096, "name": "High (48 kHz stereo)"},
+    "medium": {"rate": 44100, "channels": 2, "buffer": 4096, "name": "Medium (44.1 kHz stereo)"},
+    "low":    {"rate": 44100, "channels": 1, "buffer": 4096, "name": "Low (44.1 kHz mono)"}
 }
 
 # Default fallback
@@ -26,6 +57,18 @@ SETTINGS_FILE = "voice_recorder_settings.json"
 
 RECORDINGS_DIR = "recordings"
 TRASH_DIR = "trash"
+
+# Headroom between the audio callback and the disk writer. Audio is drained to
+# the WAV file as it arrives, so the ring only ever holds a small backlog.
+RING_SECONDS = 30
+
+# Size of the standard PCM WAV header built by make_wav_header().
+WAV_HEADER_BYTES = 44
+
+# Recordings up to this size are loaded whole before playback, so the
+# callback serves plain slices instead of walking wave's chunk state
+# machine; bigger files keep streaming from disk.
+PLAYBACK_IN_MEMORY_BYTES = 50 * 1024 * 1024
 # ---------------------------------------------
 
 os.makedirs(RECORDINGS_DIR, exist_ok=True)
@@ -45,6 +88,7 @@ def load_quality_setting():
             q = data.get("quality")
             if isinstance(q, str) and q in QUALITY_PRESETS:
                 CURRENT_QUALITY = q
+                _refresh_quality_cache()
     except (json.JSONDecodeError, OSError, TypeError):
         pass  # keep default if file is broken or unreadable
 
@@ -57,49 +101,157 @@ def save_quality_setting():
         pass  # silent fail – better than crashing the program
 
 
+# Values derived from CURRENT_QUALITY. Quality only changes through the
+# settings menu, so these are plain globals refreshed on change rather than
+# dict lookups on every call from the audio and UI paths.
+_RATE = _CHANNELS = _QUALITY_NAME = _BUFFER = None
+
+
+def _refresh_quality_cache():
+    global _RATE, _CHANNELS, _QUALITY_NAME, _BUFFER
+    preset = QUALITY_PRESETS[CURRENT_QUALITY]
+    _RATE = preset["rate"]
+    _CHANNELS = preset["channels"]
+    _QUALITY_NAME = preset["name"]
+    _BUFFER = CHUNK or preset["buffer"]
+
+
+_refresh_quality_cache()
+
+
 def get_rate():
-    return QUALITY_PRESETS[CURRENT_QUALITY]["rate"]
+    return _RATE
 
 
 def get_channels():
-    return QUALITY_PRESETS[CURRENT_QUALITY]["channels"]
+    return _CHANNELS
 
 
 def get_quality_name():
-    return QUALITY_PRESETS[CURRENT_QUALITY]["name"]
+    return _QUALITY_NAME
+
+
+def get_buffer():
+    return _BUFFER
+
+
+# Anything not in this class is stripped from user-supplied file names.
+_NAME_SANITIZE_RE = re.compile(r"[^\w \-()\[\]]")
+
+# Case-insensitive .wav check without allocating a lowercased copy of every
+# name on every directory scan.
+_WAV_SUFFIX_RE = re.compile(r"\.wav$", re.IGNORECASE)
+
+
+def is_wav_name(name):
+    return _WAV_SUFFIX_RE.search(name) is not None
+
+
+def sanitize_name(name):
+    return _NAME_SANITIZE_RE.sub("", name).strip()
+
+
+# Built once; colored() used to rebuild this dict on every single call.
+_COLORS = {
+    "red": "\033[91m",
+    "green": "\033[92m",
+    "yellow": "\033[93m",
+    "blue": "\033[94m",
+    "cyan": "\033[96m",
+    "magenta": "\033[95m"
+}
+_RESET = "\033[0m"
 
 
 def colored(text, color):
-    colors = {
-        "red": "\033[91m",
-        "green": "\033[92m",
-        "yellow": "\033[93m",
-        "blue": "\033[94m",
-        "cyan": "\033[96m",
-        "magenta": "\033[95m",
-        "reset": "\033[0m"
-    }
-    return f"{colors.get(color, '')}{text}{colors['reset']}"
+    return f"{_COLORS.get(color, '')}{text}{_RESET}"
+
+
+# Divider lines are printed on every redraw of every screen; build the
+# colored strings once instead of re-allocating them per render.
+DIVIDER_40 = colored("─" * 40, "blue")
+DIVIDER_75 = colored("─" * 75, "blue")
+DIVIDER_40_RED = colored("─" * 40, "red")
 
 
 def clear():
-    os.system('cls' if os.name == 'nt' else 'clear')
+    # One write instead of fork+exec'ing cls/clear for every screen. The UI
+    # already assumes an ANSI terminal for all its colors and cursor moves.
+    sys.stdout.write("\033[2J\033[H")
+    sys.stdout.flush()
+
+
+_columns = None
+
+
+def get_columns():
+    """Terminal width, read lazily and cached until the terminal is resized."""
+    global _columns
+    if _columns is None:
+        _columns = shutil.get_terminal_size().columns
+    return _columns
+
+
+def _invalidate_columns(signum, frame):
+    global _columns
+    _columns = None
 
 
-columns = shutil.get_terminal_size().columns
+if hasattr(signal, "SIGWINCH"):
+    signal.signal(signal.SIGWINCH, _invalidate_columns)
 
 stop_event = Event()
 pause_event = Event()
 playback_event = Event()
-frames = []
+
+# Preallocated ring buffer for captured audio. The PortAudio callback is the
+# only writer and the save/preview paths are the only readers (single producer,
+# single consumer), so the plain int offset stores below are atomic under the
+# GIL and no lock is needed. Offsets grow monotonically; the byte position in
+# the buffer is offset % ring_capacity.
+ring_buf = None
+ring_capacity = 0
+ring_write = 0
+ring_read = 0
+ring_data = Event()     # set by the callback whenever new audio lands
+
+# Destination WAV file, opened up front and written as audio arrives. "Save"
+# just patches the header sizes and renames it into place; "Discard" unlinks
+# it.
+rec_file = None
+rec_path = None
+rec_bytes_written = 0
+drain_thread = None
+
+# Input over/underflows reported by PortAudio for the current take.
+input_xruns = 0
+
 p = None
 stream = None
-recording_start_time = 0
-paused_duration = 0
-last_pause_time = 0
-frames_lock = Lock()
+
+
+def get_pa():
+    """Process-wide PyAudio instance. Importing pyaudio and Pa_Initialize
+    both cost real time (device enumeration can take hundreds of ms), so
+    pay for them once, on first audio use."""
+    global pyaudio, FORMAT, p
+    if p is None:
+        import pyaudio
+        FORMAT = pyaudio.paInt16
+        p = pyaudio.PyAudio()
+        atexit.register(p.terminate)
+    return p
+
+
+# Wall-clock origin of the running take. Pausing records when the pause
+# began; resuming advances effective_start by the paused span, so elapsed
+# time is always just now - effective_start.
+effective_start = 0
+pause_began = 0
 preview_p = None
 preview_stream = None
+preview_done = Event()   # set whenever no preview thread is running
+preview_done.set()
 is_playing_preview = False
 playback_paused = False
 is_discarding = False
@@ -112,105 +264,255 @@ ICONS = {
     "playback_paused": "❚❚"
 }
 
+# update_display repaints these every tick; they never change, so build each
+# state's status line and control hint once at import.
+STATE_LINES = {
+    "recording": f"{colored(ICONS['recording'], 'red')} {colored('Recording...', 'green')}",
+    "recording_paused": f"{ICONS['paused']} {colored('Recording Paused', 'yellow')}",
+    "preview_playing": f"{ICONS['playing']} {colored('Listening to Preview', 'cyan')}",
+    "preview_paused": f"{ICONS['playback_paused']} {colored('Preview Paused', 'yellow')}"
+}
+
+STATE_CONTROLS = {
+    "recording": colored("P=pause  L=listen  S=save  D=discard  Ctrl+C=save+exit", "yellow"),
+    "recording_paused": colored("P=resume  L=listen  S=save  D=discard", "cyan"),
+    "preview_playing": colored("Space=pause  S=stop  P=resume rec.", "cyan"),
+    "preview_paused": colored("Space=resume  S=stop  P=resume rec.", "cyan")
+}
+
+
+def make_wav_header(channels, rate, data_bytes):
+    """The 44-byte PCM WAV header, built in one struct.pack call."""
+    return struct.pack(
+        '<4sI4s4sIHHIIHH4sI',
+        b'RIFF', 36 + data_bytes, b'WAVE',
+        b'fmt ', 16, 1, channels,
+        rate, rate * channels * SAMPLE_WIDTH, channels * SAMPLE_WIDTH,
+        SAMPLE_WIDTH * 8,
+        b'data', data_bytes
+    )
+
+
+def ring_pending():
+    return ring_write - ring_read
+
+
+def ring_reset():
+    global ring_write, ring_read
+    ring_write = 0
+    ring_read = 0
+
+
+def drain_ring():
+    """Consumer side of the ring: copies captured audio into the open WAV.
+
+    Writes straight from a memoryview over the ring into the buffered file
+    — no intermediate bytes objects and no wave-module bookkeeping per
+    write. ring_read is only advanced after the write completes, which
+    keeps the region safe from the producer.
+    """
+    global ring_read, rec_bytes_written
+
+    mv = memoryview(ring_buf)
+    while True:
+        r = ring_read
+        n = ring_write - r
+        if n:
+            start = r % ring_capacity
+            # Stop at the wrap point; the next pass picks up the rest.
+            n = min(n, ring_capacity - start)
+            rec_file.write(mv[start:start + n])
+            rec_bytes_written += n
+            ring_read = r + n
+        elif stop_event.is_set():
+            return
+        else:
+            ring_data.wait(0.5)
+            ring_data.clear()
+
 
 def callback(in_data, frame_count, time_info, status):
+    global ring_write, input_xruns
+
+    if status:
+        input_xruns += 1
+
     if stop_event.is_set():
-        return (None, pyaudio.paComplete)
+        return (None, PA_COMPLETE)
 
     if pause_event.is_set():
-        silence = b'\x00' * (frame_count * get_channels() * 2)
-        return (silence, pyaudio.paContinue)
-
-    with frames_lock:
-        frames.append(in_data)
-    return (None, pyaudio.paContinue)
+        # For an input stream PortAudio ignores the returned buffer, so no
+        # need to allocate a block of silence just to throw it away.
+        return (None, PA_CONTINUE)
+
+    n = len(in_data)
+    if ring_write - ring_read + n <= ring_capacity:
+        w = ring_write % ring_capacity
+        end = w + n
+        if end <= ring_capacity:
+            ring_buf[w:end] = in_data
+        else:
+            first = ring_capacity - w
+            ring_buf[w:] = in_data[:first]
+            ring_buf[:n - first] = in_data[first:]
+        # Publish only after the bytes are in place.
+        ring_write += n
+        ring_data.set()
+    return (None, PA_CONTINUE)
 
 
 def start_recording():
-    global p, stream, frames, recording_start_time, paused_duration, is_discarding, save_requested
-    frames = []
+    global stream, ring_buf, ring_capacity, effective_start, pause_began, is_discarding, save_requested
+    global rec_file, rec_path, rec_bytes_written, drain_thread, input_xruns
+
+    capacity = get_rate() * get_channels() * SAMPLE_WIDTH * RING_SECONDS
+    if ring_buf is None or ring_capacity != capacity:
+        ring_buf = bytearray(capacity)
+        ring_capacity = capacity
+    ring_reset()
+    ring_data.clear()
+    input_xruns = 0
+
     stop_event.clear()
     pause_event.clear()
     playback_event.clear()
-    recording_start_time = time.time()
-    paused_duration = 0
+    effective_start = time.time()
+    pause_began = 0
     is_discarding = False
     save_requested = False
 
-    p = pyaudio.PyAudio()
+    get_pa()
+
+    # Open the destination WAV right away (as a hidden .part file) so frames
+    # stream to disk as they arrive instead of piling up in RAM. The data
+    # size in the header is patched when the file is finished.
+    timestamp = time.strftime("%Y-%m-%d_%H-%M-%S")
+    rec_path = os.path.join(RECORDINGS_DIR, f"._rec_{timestamp}.part")
+    rec_file = open(rec_path, 'wb', buffering=64 * 1024)
+    rec_file.write(make_wav_header(get_channels(), get_rate(), 0))
+    rec_bytes_written = 0
+
     stream = p.open(
         format=FORMAT,
         channels=get_channels(),
         rate=get_rate(),
         input=True,
-        frames_per_buffer=CHUNK,
+        frames_per_buffer=get_buffer(),
         stream_callback=callback
     )
     stream.start_stream()
 
+    drain_thread = Thread(target=drain_ring, daemon=True)
+    drain_thread.start()
+
 
 def pause_recording():
-    global last_pause_time
+    global pause_began
     pause_event.set()
-    last_pause_time = time.time()
+    pause_began = time.time()
 
 
 def resume_recording():
-    global paused_duration, last_pause_time
-    if last_pause_time > 0:
-        paused_duration += time.time() - last_pause_time
-        last_pause_time = 0
+    global effective_start, pause_began
+    if pause_began > 0:
+        effective_start += time.time() - pause_began
+        pause_began = 0
     pause_event.clear()
 
 
-def save_current_recording_to_temp():
-    with frames_lock:
-        if not frames:
-            return None
+def flush_recording_file():
+    """Push everything captured so far to disk. Returns the file path, or
+    None if nothing has been recorded yet."""
+    if rec_file is None:
+        return None
+
+    # Wake the drainer and wait for it to catch up with the callback.
+    while ring_pending() > 0 and drain_thread.is_alive():
+        ring_data.set()
+        time.sleep(0.01)
 
-        temp_file = tempfile.NamedTemporaryFile(suffix='.wav', delete=False)
-        wf = wave.open(temp_file.name, 'wb')
-        wf.setnchannels(get_channels())
-        wf.setsampwidth(p.get_sample_size(FORMAT))
-        wf.setframerate(get_rate())
-        wf.writeframes(b''.join(frames))
-        wf.close()
-        return temp_file.name
+    if rec_bytes_written == 0:
+        return None
+
+    rec_file.flush()
+    return rec_path
+
+
+def open_playback_stream(read_chunk, channels, rate, width=SAMPLE_WIDTH):
+    """Open a started output stream fed by read_chunk(nbytes).
+
+    The callback stops as soon as playback_event is set, and sets it
+    itself when read_chunk runs out of audio, so preview and library
+    playback both wait on the same event instead of polling.
+    """
+    p = get_pa()
+    bytes_per_frame = channels * width
+
+    def callback_playback(in_data, frame_count, time_info, status):
+        if playback_event.is_set():
+            return (None, PA_COMPLETE)
+        want = frame_count * bytes_per_frame
+        data = read_chunk(want)
+        if len(data) < want:
+            # Out of audio — wake the waiting thread.
+            playback_event.set()
+            return (data, PA_COMPLETE)
+        return (data, PA_CONTINUE)
+
+    stream = p.open(
+        format=p.get_format_from_width(width),
+        channels=channels,
+        rate=rate,
+        output=True,
+        # ~93 ms at 44.1 kHz: playback has no latency requirement, so fire
+        # the Python callback as rarely as PortAudio lets us.
+        frames_per_buffer=4096,
+        stream_callback=callback_playback
+    )
+    stream.start_stream()
+    return stream
 
 
 def play_preview():
     global is_playing_preview, playback_paused, preview_p, preview_stream
 
-    temp_file = save_current_recording_to_temp()
-    if not temp_file:
+    preview_path = flush_recording_file()
+    if not preview_path:
         return
 
     is_playing_preview = True
     playback_paused = False
     playback_event.clear()
+    preview_done.clear()
 
     try:
-        preview_p = pyaudio.PyAudio()
-
-        with wave.open(temp_file, 'rb') as wf:
-            def callback_playback(in_data, frame_count, time_info, status):
-                if playback_event.is_set():
-                    return (None, pyaudio.paComplete)
-                data = wf.readframes(frame_count)
-                return (data, pyaudio.paContinue)
-
-            preview_stream = preview_p.open(
-                format=preview_p.get_format_from_width(wf.getsampwidth()),
-                channels=wf.getnchannels(),
-                rate=wf.getframerate(),
-                output=True,
-                stream_callback=callback_playback
-            )
-
-            preview_stream.start_stream()
-
-            while preview_stream.is_active() and not playback_event.is_set():
-                time.sleep(0.1)
+        preview_p = get_pa()
+
+        # The header of the in-progress file still says 0 data bytes (it is
+        # patched on finish), so read the PCM data directly — the format is
+        # ours.
+        # mmap gives the callback bounded slices out of the page cache with
+        # no buffered-file machinery per tick.
+        with open(preview_path, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            end = WAV_HEADER_BYTES + rec_bytes_written
+            pos = WAV_HEADER_BYTES
+
+            def read_chunk(want):
+                nonlocal pos
+                data = mm[pos:min(pos + want, end)]
+                pos += len(data)
+                return data
+
+            preview_stream = open_playback_stream(
+                read_chunk, get_channels(), get_rate())
+
+            # Sleep until the callback runs out of audio or the user stops
+            # the preview; the coarse timeout is only a safety net in case
+            # the stream dies without either event firing.
+            while not playback_event.wait(0.5):
+                if not playback_paused and not preview_stream.is_active():
+                    break
 
     except Exception as e:
         print(f"Playback error: {e}")
@@ -218,16 +520,16 @@ def play_preview():
         if preview_stream:
             preview_stream.stop_stream()
             preview_stream.close()
-        if preview_p:
-            preview_p.terminate()
-        if os.path.exists(temp_file):
-            os.unlink(temp_file)
         is_playing_preview = False
+        preview_done.set()
 
 
 def stop_preview():
     global is_playing_preview
     playback_event.set()
+    # Wait for the preview thread's teardown rather than guessing with a
+    # sleep; the timeout only guards against a wedged stream.
+    preview_done.wait(0.5)
     is_playing_preview = False
 
 
@@ -245,22 +547,53 @@ def resume_preview():
         playback_paused = False
 
 
+def move_file(src, dst):
+    """Move with a bare-rename fast path. recordings/ and trash/ live next
+    to each other so they are almost always on one filesystem, where a
+    single rename does the job; shutil.move's stat/copy machinery only
+    runs for the cross-device case."""
+    try:
+        os.rename(src, dst)
+    except OSError:
+        shutil.move(src, dst)
+
+
 def move_to_trash(filename):
     src = os.path.join(RECORDINGS_DIR, filename)
-    dst = os.path.join(TRASH_DIR, filename)
 
+    # One directory snapshot instead of an exists() stat per candidate —
+    # trash dirs full of numbered duplicates made the probe O(n) syscalls.
+    existing = {e.name for e in os.scandir(TRASH_DIR)}
+    name = filename
     base, ext = os.path.splitext(filename)
     counter = 1
-    while os.path.exists(dst):
-        dst = os.path.join(TRASH_DIR, f"{base}_{counter}{ext}")
+    while name in existing:
+        name = f"{base}_{counter}{ext}"
         counter += 1
 
-    shutil.move(src, dst)
-    return os.path.basename(dst)
+    move_file(src, os.path.join(TRASH_DIR, name))
+    return name
+
+
+def finish_recording_file():
+    """Stop the drainer, patch the real sizes into the WAV header and close.
+
+    Callers must set stop_event first so the drainer exits once the ring
+    is empty.
+    """
+    global rec_file
+    if drain_thread is not None and drain_thread.is_alive():
+        ring_data.set()
+        drain_thread.join(timeout=5)
+    if rec_file is not None:
+        rec_file.seek(0)
+        rec_file.write(make_wav_header(get_channels(), get_rate(), rec_bytes_written))
+        rec_file.close()
+        rec_file = None
 
 
 def discard_recording():
-    global stream, p, frames, is_discarding
+    global stream, is_discarding
 
     stop_event.set()
     stop_preview()
@@ -270,11 +603,11 @@ def discard_recording():
     if stream:
         stream.stop_stream()
         stream.close()
-    if p:
-        p.terminate()
 
-    with frames_lock:
-        frames.clear()
+    finish_recording_file()
+    if rec_path and os.path.exists(rec_path):
+        os.unlink(rec_path)
+    ring_reset()
 
     is_discarding = True
 
@@ -282,32 +615,40 @@ def discard_recording():
     time.sleep(1.2)
 
 
-def get_elapsed_time(start_time):
-    if pause_event.is_set() and not is_playing_preview:
-        current_pause_duration = time.time() - last_pause_time
-        elapsed_secs = int((time.time() - start_time) - paused_duration - current_pause_duration)
+_elapsed_cache = (-1, "")
+
+
+def get_elapsed_time():
+    global _elapsed_cache
+
+    if pause_began > 0:
+        elapsed_secs = int(pause_began - effective_start)
     else:
-        elapsed_secs = int((time.time() - start_time) - paused_duration)
+        elapsed_secs = int(time.time() - effective_start)
 
-    return str(timedelta(seconds=elapsed_secs))
+    # The string only changes once a second; skip re-formatting until then.
+    cached_secs, cached_str = _elapsed_cache
+    if elapsed_secs == cached_secs:
+        return cached_str
+
+    hours, rem = divmod(elapsed_secs, 3600)
+    minutes, secs = divmod(rem, 60)
+    text = f"{hours}:{minutes:02d}:{secs:02d}"
+    _elapsed_cache = (elapsed_secs, text)
+    return text
 
 
 def stop_recording_and_save(custom_name_ask=False):
-    global stream, p, paused_duration, last_pause_time, save_requested
+    global stream, save_requested
     stop_event.set()
 
     stop_preview()
 
-    if last_pause_time > 0:
-        paused_duration += time.time() - last_pause_time
-
     time.sleep(0.4)
 
     if stream:
         stream.stop_stream()
         stream.close()
-    if p:
-        p.terminate()
 
     timestamp = time.strftime("%Y-%m-%d_%H-%M-%S")
     default_name = f"recording_{timestamp}.wav"
@@ -319,8 +660,7 @@ def stop_recording_and_save(custom_name_ask=False):
         custom = input(colored("Enter custom name (or press Enter for default): ", "yellow")).strip()
 
         if custom:
-            custom = "".join(c for c in custom if c.isalnum() or c in " -_()[]")
-            custom = custom.strip()
+            custom = sanitize_name(custom)
             if not custom.lower().endswith('.wav'):
                 custom += '.wav'
             filename = os.path.join(RECORDINGS_DIR, custom)
@@ -330,22 +670,66 @@ def stop_recording_and_save(custom_name_ask=False):
         filename = os.path.join(RECORDINGS_DIR, default_name)
 
     try:
-        wf = wave.open(filename, 'wb')
-        wf.setnchannels(get_channels())
-        wf.setsampwidth(p.get_sample_size(FORMAT))
-        wf.setframerate(get_rate())
-
-        with frames_lock:
-            wf.writeframes(b''.join(frames))
-        wf.close()
+        finish_recording_file()
+        os.replace(rec_path, filename)
 
         print("\n" + colored("✓ Saved successfully!", "green"))
         print(colored(f"   {filename}", "yellow"))
 
+        if input_xruns:
+            print(colored(f"⚠ {input_xruns} audio buffer over/underruns during this take "
+                          f"(try RECORDER_CHUNK=8192)", "yellow"))
+
     except Exception as e:
         print(colored(f"Error saving file: {e}", "red"))
 
 
+_saved_term = None
+
+
+def term_raw_input(enable):
+    """Toggle cbreak mode on POSIX so single keypresses arrive without
+    Enter, set once per screen instead of relying on the shell's terminal
+    state. No-op on Windows, where msvcrt.getch already behaves that way."""
+    global _saved_term
+    if sys.platform == 'win32':
+        return
+    fd = sys.stdin.fileno()
+    try:
+        if enable and _saved_term is None:
+            _saved_term = termios.tcgetattr(fd)
+            tty.setcbreak(fd)
+        elif not enable and _saved_term is not None:
+            termios.tcsetattr(fd, termios.TCSADRAIN, _saved_term)
+            _saved_term = None
+    except (termios.error, OSError):
+        _saved_term = None
+
+
+def wait_for_key(timeout):
+    """Block up to `timeout` seconds for one keypress; returns None on timeout.
+
+    On Unix we sleep in the kernel via select. Windows has no selectable
+    stdin, so we fall back to a short kbhit poll there.
+    """
+    if sys.platform == 'win32':
+        deadline = time.time() + timeout
+        while True:
+            if msvcrt.kbhit():
+                return msvcrt.getch().decode('utf-8', errors='ignore').lower()
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                return None
+            time.sleep(min(0.05, remaining))
+    else:
+        if select.select([sys.stdin], [], [], timeout)[0]:
+            # One byte straight from the fd: no TextIOWrapper buffering or
+            # codec machinery between the keypress and us. All our hotkeys
+            # are ASCII, so anything else decodes to "" and is ignored.
+            return os.read(sys.stdin.fileno(), 1).decode('ascii', 'ignore').lower()
+        return None
+
+
 def get_current_state():
     if is_playing_preview:
         if playback_paused:
@@ -361,44 +745,46 @@ def record():
     global save_requested
 
     clear()
-    print(f"🎤 Voice Recorder  –  {get_quality_name()}".center(columns))
-    print(colored("─" * 40, "blue"))
+    print(f"🎤 Voice Recorder  –  {get_quality_name()}".center(get_columns()))
+    print(DIVIDER_40)
 
-    start_time = time.time()
     start_recording()
 
     print("\n" + colored("Quick Help:", "cyan"))
     print("  P = Pause/Resume   L = Listen   S = Save   D = Discard   Ctrl+C = Save & Exit")
-    print(colored("─" * 40, "blue") + "\n")
+    print(DIVIDER_40 + "\n")
+
+    term_raw_input(True)
 
     try:
+        global _drawn_state
+        _drawn_state = None
+
         print(f"{ICONS['recording']} Recording...")
         print(f"⏱️  Time: 0:00:00")
         print("\n" + colored("Press 'P' to pause", "yellow"))
 
         display_lines = 4
+        last_rendered = None
 
         while True:
-            key = None
-            if sys.platform == 'win32':
-                import msvcrt
-                if msvcrt.kbhit():
-                    key = msvcrt.getch().decode('utf-8', errors='ignore').lower()
-            else:
-                import select
-                if select.select([sys.stdin], [], [], 0)[0]:
-                    key = sys.stdin.read(1).lower()
-
+            # Only repaint when something visible actually changed.
+            rendered = (get_current_state(), get_elapsed_time())
+            if rendered != last_rendered:
+                update_display(display_lines)
+                last_rendered = rendered
+
+            # Sleep until the next whole second of the clock, or a keypress.
+            timeout = 1.0 - ((time.time() - effective_start) % 1.0)
+            key = wait_for_key(timeout)
             if key:
-                handle_keypress(key, start_time)
-
-            update_display(start_time, display_lines)
-
-            time.sleep(0.1)
+                handle_keypress(key)
 
     except KeyboardInterrupt:
         global is_discarding
 
+        term_raw_input(False)
+
         print(colored("\n\n⏹️  Stopping...", "yellow"))
 
         if not is_discarding and not save_requested:
@@ -408,10 +794,12 @@ def record():
             print(colored("Recording discarded, no save performed.", "yellow"))
 
         input("\nPress Enter to return to menu...")
+    finally:
+        term_raw_input(False)
 
 
-def handle_keypress(key, start_time):
-    global last_pause_time, paused_duration, save_requested
+def handle_keypress(key):
+    global save_requested
 
     state = get_current_state()
 
@@ -425,7 +813,6 @@ def handle_keypress(key, start_time):
             resume_recording()
         else:
             pause_recording()
-            last_pause_time = time.time()
 
     elif key == 'l':
         if state != "recording_paused":
@@ -450,6 +837,7 @@ def handle_keypress(key, start_time):
         else:
             print(colored("\nSaving now...", "yellow"))
             save_requested = True
+            term_raw_input(False)   # the name prompt needs echo back
             stop_recording_and_save(custom_name_ask=True)
             raise KeyboardInterrupt
 
@@ -460,11 +848,14 @@ def handle_keypress(key, start_time):
             return
 
         print(colored("\nAre you sure you want to DISCARD this recording? (y/N): ", "red"), end="")
+        sys.stdout.flush()
+        term_raw_input(False)   # the confirmation prompt needs echo back
         confirm = input().strip().lower()
         if confirm in ('y', 'yes'):
             discard_recording()
             raise KeyboardInterrupt
         else:
+            term_raw_input(True)
             print(colored("Discard cancelled.", "green"))
             time.sleep(0.8)
 
@@ -475,48 +866,101 @@ def handle_keypress(key, start_time):
             resume_preview()
 
 
-def update_display(start_time, display_lines):
-    elapsed_str = get_elapsed_time(start_time)
+# State shown by the last update_display frame; record() resets it when the
+# screen is rebuilt so the first tick paints everything.
+_drawn_state = None
+
+
+def update_display(display_lines):
+    global _drawn_state
+
+    elapsed_str = get_elapsed_time()
     state = get_current_state()
 
-    sys.stdout.write(f"\033[{display_lines}A")
-    sys.stdout.write("\033[2K")
+    if state == _drawn_state:
+        # Only the clock changed — rewrite just that line (second from the
+        # top of the frame) instead of all four.
+        frame = (
+            f"\033[{display_lines - 1}A"
+            f"\r\033[2K⏱️  Time: {elapsed_str}"
+            f"\033[{display_lines - 1}B\r"
+        )
+    else:
+        # Build the whole frame and emit it with one write: one syscall and
+        # one stdout-lock acquire per repaint instead of seven, so no
+        # tearing.
+        frame = (
+            f"\033[{display_lines}A"
+            f"\033[2K{STATE_LINES[state]}\n"
+            f"\033[2K⏱️  Time: {elapsed_str}\n"
+            f"\033[2K\n"
+            f"\033[2K{STATE_CONTROLS[state]}\n"
+        )
+        _drawn_state = state
+    sys.stdout.write(frame)
+    sys.stdout.flush()
 
-    if state == "recording":
-        print(f"{colored(ICONS['recording'], 'red')} {colored('Recording...', 'green')}")
-        controls = colored("P=pause  L=listen  S=save  D=discard  Ctrl+C=save+exit", "yellow")
-    elif state == "recording_paused":
-        print(f"{ICONS['paused']} {colored('Recording Paused', 'yellow')}")
-        controls = colored("P=resume  L=listen  S=save  D=discard", "cyan")
-    elif state == "preview_playing":
-        print(f"{ICONS['playing']} {colored('Listening to Preview', 'cyan')}")
-        controls = colored("Space=pause  S=stop  P=resume rec.", "cyan")
-    elif state == "preview_paused":
-        print(f"{ICONS['playback_paused']} {colored('Preview Paused', 'yellow')}")
-        controls = colored("Space=resume  S=stop  P=resume rec.", "cyan")
 
-    sys.stdout.write("\033[2K")
-    print(f"⏱️  Time: {elapsed_str}")
+def list_wav_files(directory):
+    """Names of the .wav files in a directory, from a single scandir pass."""
+    with os.scandir(directory) as it:
+        return [e.name for e in it if is_wav_name(e.name) and e.is_file()]
 
-    sys.stdout.write("\033[2K")
-    print()
 
-    sys.stdout.write("\033[2K")
-    print(controls)
+# path -> ((mtime, size), duration). The list screens ask for every file's
+# duration on every redraw; only re-open files that actually changed.
+_duration_cache = {}
 
-    sys.stdout.flush()
+# mtime -> "YYYY-mm-dd HH:MM". strftime walks tzdata on every call; rows
+# keep the same mtime across redraws so the formatted string is memoized.
+_mtime_str_cache = {}
+
+
+def format_mtime(mtime):
+    s = _mtime_str_cache.get(mtime)
+    if s is None:
+        s = time.strftime("%Y-%m-%d %H:%M", time.localtime(mtime))
+        _mtime_str_cache[mtime] = s
+    return s
 
 
-def get_file_duration(file_path):
+def get_file_duration(file_path, st=None):
+    if st is None:
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            _duration_cache.pop(file_path, None)
+            return 0
+
+    key = (st.st_mtime, st.st_size)
+    cached = _duration_cache.get(file_path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    duration = 0
     try:
-        with wave.open(file_path, 'rb') as wf:
-            frames = wf.getnframes()
-            rate = wf.getframerate()
-            duration = frames / float(rate)
-            return duration
+        # Our own files have the canonical 44-byte header (we write it in
+        # make_wav_header), so one small read answers the probe without
+        # building a Wave_read. Anything with extra chunks falls through
+        # to the wave module below.
+        with open(file_path, 'rb') as f:
+            h = f.read(WAV_HEADER_BYTES)
+        if (len(h) == WAV_HEADER_BYTES and h[:4] == b'RIFF'
+                and h[8:16] == b'WAVEfmt ' and h[36:40] == b'data'):
+            channels, rate = struct.unpack_from('<HI', h, 22)
+            bits = struct.unpack_from('<H', h, 34)[0]
+            data_size = struct.unpack_from('<I', h, 40)[0]
+            if channels and rate and bits:
+                duration = data_size / (rate * channels * (bits // 8))
+        else:
+            with wave.open(file_path, 'rb') as wf:
+                duration = wf.getnframes() / float(wf.getframerate())
     except:
         return 0
 
+    _duration_cache[file_path] = (key, duration)
+    return duration
+
 
 def format_duration(seconds):
     hours = int(seconds // 3600)
@@ -538,8 +982,8 @@ def settings_menu():
 
     while True:
         clear()
-        print("⚙️  Settings".center(columns))
-        print(colored("─" * 40, "blue") + "\n")
+        print("⚙️  Settings".center(get_columns()))
+        print(DIVIDER_40 + "\n")
 
         print(f"Current recording quality: {colored(get_quality_name(), 'green')}\n")
         print("Available presets:\n")
@@ -554,6 +998,7 @@ def settings_menu():
 
         if sel in QUALITY_PRESETS:
             CURRENT_QUALITY = sel
+            _refresh_quality_cache()
             save_quality_setting()
             print(colored(f"\nQuality updated to: {get_quality_name()}", "green"))
             time.sleep(1.6)
@@ -576,16 +1021,18 @@ def restore_from_trash(file_index, files):
 
     filename = files[file_index - 1]
     src = os.path.join(TRASH_DIR, filename)
-    dst = os.path.join(RECORDINGS_DIR, filename)
 
+    existing = {e.name for e in os.scandir(RECORDINGS_DIR)}
+    name = filename
     counter = 1
     base, ext = os.path.splitext(filename)
-    while os.path.exists(dst):
-        dst = os.path.join(RECORDINGS_DIR, f"{base} (restored {counter}){ext}")
+    while name in existing:
+        name = f"{base} (restored {counter}){ext}"
         counter += 1
+    dst = os.path.join(RECORDINGS_DIR, name)
 
     try:
-        shutil.move(src, dst)
+        move_file(src, dst)
         print(colored(f"\n✓ Restored: {os.path.basename(dst)}", "green"))
         time.sleep(1.8)
     except Exception as e:
@@ -603,8 +1050,8 @@ def permanent_delete_from_trash(file_index, files):
     path = os.path.join(TRASH_DIR, filename)
 
     clear()
-    print(colored("⚠️  PERMANENT DELETE", "red").center(columns))
-    print(colored("─" * 40, "red") + "\n")
+    print(colored("⚠️  PERMANENT DELETE", "red").center(get_columns()))
+    print(DIVIDER_40_RED + "\n")
     print(f"File: {colored(filename, 'yellow')}")
     print(colored("This action CANNOT be undone!", "red"))
 
@@ -624,10 +1071,10 @@ def permanent_delete_from_trash(file_index, files):
 
 def empty_trash():
     clear()
-    print(colored("🗑️  EMPTY TRASH", "red").center(columns))
-    print(colored("─" * 40, "red") + "\n")
+    print(colored("🗑️  EMPTY TRASH", "red").center(get_columns()))
+    print(DIVIDER_40_RED + "\n")
 
-    files = [f for f in os.listdir(TRASH_DIR) if f.lower().endswith(".wav")]
+    files = list_wav_files(TRASH_DIR)
     if not files:
         print(colored("Trash is already empty.", "yellow"))
         time.sleep(1.5)
@@ -656,37 +1103,43 @@ def trash_menu():
 
     while True:
         clear()
-        print("🗑️  Trash / Recycle Bin".center(columns))
-        print(colored("─" * 40, "blue") + "\n")
-
-        files = [f for f in os.listdir(TRASH_DIR) if f.lower().endswith(".wav")]
-
-        if not files:
+        print("🗑️  Trash / Recycle Bin".center(get_columns()))
+        print(DIVIDER_40 + "\n")
+
+        # One scandir pass gives names and deletion times together; the sort
+        # and the table below reuse the stat the directory scan already did.
+        rows = []
+        with os.scandir(TRASH_DIR) as it:
+            for e in it:
+                if not (is_wav_name(e.name) and e.is_file()):
+                    continue
+                try:
+                    mt = e.stat().st_mtime
+                except OSError:
+                    mt = 0
+                rows.append((e.name, mt))
+
+        if not rows:
             print(colored("Trash is empty", "yellow"))
             print("Deleted recordings will appear here.")
             input("\nPress Enter to return...")
             return
 
-        sort_func = lambda f: os.path.getmtime(os.path.join(TRASH_DIR, f))
-        files = sorted(files, key=sort_func, reverse=True)
+        rows.sort(key=lambda r: r[1], reverse=True)
+        files = [name for name, _ in rows]
 
         print(f"  {colored(len(files), 'magenta')} items in trash")
-        print(colored("─" * 75, "blue"))
+        print(DIVIDER_75)
 
         print(f"{colored('No.', 'cyan'):<4} {colored('Name', 'cyan'):<40} {colored('Deleted Date', 'cyan'):<20}")
-        print(colored("─" * 75, "blue"))
-
-        for i, f in enumerate(files, 1):
-            path = os.path.join(TRASH_DIR, f)
-            try:
-                mtime = time.strftime("%Y-%m-%d %H:%M", time.localtime(os.path.getmtime(path)))
-            except:
-                mtime = "—"
+        print(DIVIDER_75)
 
+        for i, (f, mt) in enumerate(rows, 1):
+            mtime = format_mtime(mt) if mt else "—"
             display_name = f if len(f) <= 38 else f[:35] + "..."
             print(f"{colored(str(i), 'yellow'):<4} {display_name:<40} {mtime:<20}")
 
-        print(colored("─" * 75, "blue"))
+        print(DIVIDER_75)
 
         print(f"\n{colored('Commands:', 'cyan')}")
         print("  [number]     select recording")
@@ -722,11 +1175,10 @@ def trash_menu():
                 if 1 <= num <= len(files):
                     filename = files[num - 1]
                     clear()
-                    print(f"🗑️  Trashed Recording: {colored(filename, 'cyan')}".center(columns))
-                    print(colored("─" * 40, "blue") + "\n")
+                    print(f"🗑️  Trashed Recording: {colored(filename, 'cyan')}".center(get_columns()))
+                    print(DIVIDER_40 + "\n")
 
-                    path = os.path.join(TRASH_DIR, filename)
-                    mtime = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(os.path.getmtime(path)))
+                    mtime = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(rows[num - 1][1]))
 
                     print(f"  Name:       {colored(filename, 'yellow')}")
                     print(f"  Deleted:    {colored(mtime, 'blue')}")
@@ -753,32 +1205,66 @@ def trash_menu():
 
 def get_sort_key_func(key):
     if key == "date":
-        return lambda f: os.path.getmtime(os.path.join(RECORDINGS_DIR, f))
+        return lambda row: row[1]
     elif key == "name":
-        return lambda f: f.lower()
+        return lambda row: row[0].lower()
     elif key == "duration":
-        return lambda f: get_file_duration(os.path.join(RECORDINGS_DIR, f))
-    return lambda f: 0
+        return lambda row: row[2]
+    return lambda row: 0
+
+
+def scan_recordings():
+    """One scandir pass over RECORDINGS_DIR giving (name, mtime, duration)
+    rows. DirEntry.stat() reuses what the directory scan already fetched, so
+    a listing costs one scan instead of three stat-family calls per file."""
+    found = []
+    with os.scandir(RECORDINGS_DIR) as it:
+        for e in it:
+            if not (is_wav_name(e.name) and e.is_file()):
+                continue
+            try:
+                st = e.stat()
+            except OSError:
+                continue
+            found.append((e.name, st.st_mtime, e.path, st))
+
+    # Probe uncached durations in parallel first: each probe is I/O-bound
+    # and releases the GIL while reading, so a small pool overlaps the disk
+    # latency of many files. Results land in _duration_cache.
+    misses = [(path, st) for _, _, path, st in found
+              if (cached := _duration_cache.get(path)) is None
+              or cached[0] != (st.st_mtime, st.st_size)]
+    if len(misses) > 1:
+        with ThreadPoolExecutor(max_workers=min(8, len(misses))) as ex:
+            for _ in ex.map(lambda args: get_file_duration(*args), misses):
+                pass
+
+    return [(name, mtime, get_file_duration(path, st))
+            for name, mtime, path, st in found]
 
 
 def list_of_recordings():
     global sort_key, sort_reverse
 
+    # Scanned once on entry; single-file changes (rename/trash) are applied
+    # to the in-memory rows instead of re-walking the directory.
+    rows = scan_recordings()
+
     while True:
         clear()
-        print("📁 Recordings".center(columns))
-        print(colored("─" * 40, "blue") + "\n")
-
-        files = [f for f in os.listdir(RECORDINGS_DIR) if f.lower().endswith(".wav")]
+        print("📁 Recordings".center(get_columns()))
+        print(DIVIDER_40 + "\n")
 
-        if not files:
+        if not rows:
             print(colored("No recordings yet", "yellow"))
             print("Record something first!")
             input("\nPress Enter to return to menu...")
             return
 
-        sort_func = get_sort_key_func(sort_key)
-        files = sorted(files, key=sort_func, reverse=sort_reverse)
+        # Re-sorting an already-sorted list is near-linear, so this is cheap
+        # even though it runs every redraw.
+        rows.sort(key=get_sort_key_func(sort_key), reverse=sort_reverse)
+        files = [name for name, _, _ in rows]
 
         sort_names = {"date": "Date Created", "name": "Name", "duration": "Duration"}
         sort_name = sort_names.get(sort_key, "Unknown")
@@ -786,22 +1272,15 @@ def list_of_recordings():
                      "↓ Descending" if sort_reverse else "↑ Ascending"
 
         print(f"  Sorted by: {colored(sort_name, 'cyan')} {colored(order_name, 'magenta')}")
-        print(colored("─" * 75, "blue"))
+        print(DIVIDER_75)
 
         print(f"{colored('No.', 'cyan'):<4} {colored('Name', 'cyan'):<35} {colored('Duration', 'cyan'):<12} {colored('Date/Time', 'cyan'):<20}")
-        print(colored("─" * 75, "blue"))
+        print(DIVIDER_75)
 
         total_duration = 0
 
-        for i, f in enumerate(files, 1):
-            path = os.path.join(RECORDINGS_DIR, f)
-            try:
-                stat = os.stat(path)
-                mtime_str = time.strftime("%Y-%m-%d %H:%M", time.localtime(stat.st_mtime))
-            except:
-                mtime_str = "—"
-
-            dur_sec = get_file_duration(path)
+        for i, (f, mtime, dur_sec) in enumerate(rows, 1):
+            mtime_str = format_mtime(mtime) if mtime else "—"
             dur_str = format_duration(dur_sec)
 
             display_name = f if len(f) <= 33 else f[:30] + "..."
@@ -809,9 +1288,9 @@ def list_of_recordings():
             print(f"{colored(str(i), 'yellow'):<4} {display_name:<35} {dur_str:<12} {mtime_str:<20}")
             total_duration += dur_sec
 
-        print(colored("─" * 75, "blue"))
+        print(DIVIDER_75)
 
-        print(f"\n{colored('Total:', 'green')} {len(files)} recordings • {format_duration(total_duration)} total duration")
+        print(f"\n{colored('Total:', 'green')} {len(rows)} recordings • {format_duration(total_duration)} total duration")
 
         print(f"\n{colored('Commands:', 'cyan')}")
         print("  [number]     select & view options")
@@ -849,10 +1328,14 @@ def list_of_recordings():
             try:
                 num = int(input(colored(f"Enter number to { {'r':'rename','d':'delete','p':'play'}[choice] }: ", "yellow")).strip())
                 if choice == 'r':
-                    rename_recording(num, files)
+                    new_name = rename_recording(num, files)
+                    if new_name:
+                        name, mtime, dur = rows[num - 1]
+                        rows[num - 1] = (new_name, mtime, dur)
                 elif choice == 'd':
                     filename = files[num - 1]
                     moved_name = move_to_trash(filename)
+                    del rows[num - 1]
                     print(colored(f"\nMoved to trash: {moved_name}", "yellow"))
                     time.sleep(1.5)
                 elif choice == 'p':
@@ -868,8 +1351,8 @@ def list_of_recordings():
                 if 1 <= num <= len(files):
                     filename = files[num - 1]
                     clear()
-                    print(f"📄 Recording: {colored(filename, 'cyan')}".center(columns))
-                    print(colored("─" * 40, "blue") + "\n")
+                    print(f"📄 Recording: {colored(filename, 'cyan')}".center(get_columns()))
+                    print(DIVIDER_40 + "\n")
 
                     path = os.path.join(RECORDINGS_DIR, filename)
                     mtime = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(os.path.getmtime(path)))
@@ -890,9 +1373,13 @@ def list_of_recordings():
                     if sub == '1':
                         play_recording(num, files)
                     elif sub == '2':
-                        rename_recording(num, files)
+                        new_name = rename_recording(num, files)
+                        if new_name:
+                            name, mtime, dur = rows[num - 1]
+                            rows[num - 1] = (new_name, mtime, dur)
                     elif sub == '3':
                         moved_name = move_to_trash(filename)
+                        del rows[num - 1]
                         print(colored(f"\nMoved to trash: {moved_name}", "yellow"))
                         time.sleep(1.5)
             except:
@@ -910,8 +1397,8 @@ def rename_recording(file_index, files):
     old_filepath = os.path.join(RECORDINGS_DIR, old_filename)
 
     clear()
-    print("📝 Rename Recording".center(columns))
-    print(colored("─" * 40, "blue") + "\n")
+    print("📝 Rename Recording".center(get_columns()))
+    print(DIVIDER_40 + "\n")
 
     print(f"Current name: {colored(old_filename, 'yellow')}")
     new_name = input(colored("New name (without .wav or Enter=cancel): ", "cyan")).strip()
@@ -919,31 +1406,43 @@ def rename_recording(file_index, files):
     if not new_name:
         print(colored("Rename cancelled.", "yellow"))
         time.sleep(1.5)
-        return
+        return None
 
-    new_name = "".join(c for c in new_name if c.isalnum() or c in " -_()[]").strip()
+    new_name = sanitize_name(new_name)
     if not new_name:
         print(colored("Invalid name!", "red"))
         time.sleep(1.5)
-        return
+        return None
 
     if not new_name.lower().endswith('.wav'):
         new_name += '.wav'
 
     new_filepath = os.path.join(RECORDINGS_DIR, new_name)
 
-    if os.path.exists(new_filepath):
-        print(colored(f"File '{new_name}' already exists!", "red"))
-        time.sleep(1.5)
-        return
-
     try:
-        os.rename(old_filepath, new_filepath)
+        # link+unlink is an atomic "rename unless the target exists" —
+        # no separate exists() check, so no race with another writer.
+        try:
+            os.link(old_filepath, new_filepath)
+            os.unlink(old_filepath)
+        except FileExistsError:
+            print(colored(f"File '{new_name}' already exists!", "red"))
+            time.sleep(1.5)
+            return None
+        except OSError:
+            # Filesystem without hard links — fall back to checked rename.
+            if os.path.exists(new_filepath):
+                print(colored(f"File '{new_name}' already exists!", "red"))
+                time.sleep(1.5)
+                return None
+            os.rename(old_filepath, new_filepath)
         print(colored(f"\n✓ Renamed: {new_name}", "green"))
         time.sleep(1.8)
+        return new_name
     except Exception as e:
         print(colored(f"Error: {e}", "red"))
         time.sleep(2)
+        return None
 
 
 def play_recording(file_index, files):
@@ -955,95 +1454,105 @@ def play_recording(file_index, files):
     filename = files[file_index - 1]
     filepath = os.path.join(RECORDINGS_DIR, filename)
 
-    clear()
-    print("▶ Playing Recording".center(columns))
-    print(colored("─" * 40, "blue") + "\n")
-
-    print(f"Now playing: {colored(filename, 'cyan')}")
     dur = get_file_duration(filepath)
-    if dur > 0:
-        print(f"Duration: {format_duration(dur)}")
+    header = (
+        f"\033[2J\033[H"
+        f"{'▶ Playing Recording'.center(get_columns())}\n"
+        f"{DIVIDER_40}\n\n"
+        f"Now playing: {colored(filename, 'cyan')}\n"
+        + (f"Duration: {format_duration(dur)}\n" if dur > 0 else "")
+        + f"\n{colored('Controls:  Space = Pause/Resume    S = Stop    other = exit', 'cyan')}\n"
+        f"{DIVIDER_40}\n\n"
+    )
+    sys.stdout.write(header)
+    sys.stdout.flush()
 
-    print("\n" + colored("Controls:  Space = Pause/Resume    S = Stop    other = exit", "cyan"))
-    print(colored("─" * 40, "blue") + "\n")
+    term_raw_input(True)
 
     try:
-        playback_p = pyaudio.PyAudio()
         with wave.open(filepath, 'rb') as wf:
-            def cb(in_data, frame_count, time_info, status):
-                if playback_event.is_set():
-                    return (None, pyaudio.paComplete)
-                data = wf.readframes(frame_count)
-                return (data, pyaudio.paContinue if data else pyaudio.paComplete)
-
-            stream = playback_p.open(
-                format=playback_p.get_format_from_width(wf.getsampwidth()),
-                channels=wf.getnchannels(),
-                rate=wf.getframerate(),
-                output=True,
-                stream_callback=cb
-            )
-            stream.start_stream()
-
-            while stream.is_active() and not playback_event.is_set():
-                if sys.platform == 'win32':
-                    import msvcrt
-                    if msvcrt.kbhit():
-                        k = msvcrt.getch().decode('utf-8', errors='ignore').lower()
-                        if k == ' ':
-                            if stream.is_active():
-                                stream.stop_stream()
-                            else:
-                                stream.start_stream()
-                        else:
-                            playback_event.set()
-                            break
+            channels = wf.getnchannels()
+            rate = wf.getframerate()
+            width = wf.getsampwidth()
+            frame_bytes = channels * width
+            nframes = wf.getnframes()
+
+            if nframes * frame_bytes <= PLAYBACK_IN_MEMORY_BYTES:
+                # Voice memos are small: read the PCM once and serve the
+                # callback plain byte slices.
+                pcm = wf.readframes(nframes)
+                pos = 0
+
+                def read_chunk(want):
+                    nonlocal pos
+                    chunk = pcm[pos:pos + want]
+                    pos += len(chunk)
+                    return chunk
+            else:
+                def read_chunk(want):
+                    return wf.readframes(want // frame_bytes)
+
+            stream = open_playback_stream(read_chunk, channels, rate, width)
+
+            # Sleep in the kernel until a key arrives; the callback sets
+            # playback_event at end of audio, so the 0.5 s timeout is just
+            # how quickly we notice that while blocked on stdin.
+            stopping = playback_event.is_set
+            poll = wait_for_key
+            paused = False
+            while not stopping():
+                k = poll(0.5)
+                if k is None:
+                    continue
+                if k == ' ':
+                    if paused:
+                        stream.start_stream()
+                    else:
+                        stream.stop_stream()
+                    paused = not paused
                 else:
-                    import select
-                    if select.select([sys.stdin], [], [], 0)[0]:
-                        k = sys.stdin.read(1).lower()
-                        if k == ' ':
-                            if stream.is_active():
-                                stream.stop_stream()
-                            else:
-                                stream.start_stream()
-                        else:
-                            playback_event.set()
-                            break
-                time.sleep(0.1)
+                    playback_event.set()
 
         stream.stop_stream()
         stream.close()
-        playback_p.terminate()
         playback_event.clear()
 
     except Exception as e:
         print(colored(f"Playback error: {e}", "red"))
+    finally:
+        term_raw_input(False)
 
     print(colored("\nPlayback finished.", "yellow"))
-    time.sleep(1)
+
+
+# The main menu only varies in the current-quality line, so the static
+# blocks around it (and the prompt) are rendered to strings once at import.
+_MENU_TOP = (
+    f"1. 📝 Record New\n   {colored('Start a new recording', 'blue')}\n\n"
+    f"2. 📁 View Recordings\n   {colored('List, play, rename, trash', 'blue')}\n\n"
+    f"3. 🗑️  Trash\n   {colored('Manage deleted recordings', 'blue')}\n\n"
+    "4. ⚙️  Settings\n"
+)
+_MENU_BOTTOM = f"5. 🚪 Exit\n   {colored('Close application', 'blue')}\n\n"
+_MENU_PROMPT = colored("Select option (1-5): ", "cyan")
 
 
 def main_screen():
     while True:
-        clear()
-        print("🎤 Voice Recorder".center(columns))
-        print(colored("─" * 40, "blue"))
-        print("\n")
-
-        menu_items = [
-            ("1. 📝 Record New", "Start a new recording"),
-            ("2. 📁 View Recordings", "List, play, rename, trash"),
-            ("3. 🗑️  Trash", "Manage deleted recordings"),
-            ("4. ⚙️  Settings", f"Current: {get_quality_name()}"),
-            ("5. 🚪 Exit", "Close application")
-        ]
-
-        for item, desc in menu_items:
-            print(f"{item}")
-            print(f"   {colored(desc, 'blue')}\n")
-
-        choice = input(colored("Select option (1-5): ", "cyan")).strip()
+        # Compose the whole screen and emit it with one write — one syscall
+        # per redraw instead of one per line.
+        frame = (
+            f"\033[2J\033[H"
+            f"{'🎤 Voice Recorder'.center(get_columns())}\n"
+            f"{DIVIDER_40}\n\n\n"
+            f"{_MENU_TOP}"
+            f"   {colored(f'Current: {get_quality_name()}', 'blue')}\n\n"
+            f"{_MENU_BOTTOM}"
+        )
+        sys.stdout.write(frame)
+        sys.stdout.flush()
+
+        choice = input(_MENU_PROMPT).strip()
 
         if choice == "1":
             record()